@@ -24,18 +24,46 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
+from functools import cached_property, lru_cache
 from itertools import combinations
+import asyncio
+import atexit
 import datetime
 import ipaddress
 import json
+import logging
 import pathlib
-import random
+import secrets
 import socket
+import struct
 import sys
+import threading
 import time
+import urllib.error
 import urllib.parse
-import urllib.request
+import urllib3
+
+try:  #`orjson` is optional, but decodes device responses considerably faster.
+	import orjson
+	_jsonLoads = orjson.loads
+	_jsonDumps = orjson.dumps
+except ImportError:
+	_jsonLoads = json.loads
+	_jsonDumps = lambda obj: json.dumps(obj).encode()
+
+_logger = logging.getLogger(__name__)
+_quote = lru_cache(maxsize=256)(urllib.parse.quote)  #For the small set of names (commands, sensors, functions, SSIDs) used in request paths.
+
+def _hexInt(value):
+	"""
+	Returns `value` as an `int`, parsing `str` values as hex (e.g. UUIDs like
+	`'A3F1'`).
+	"""
+	return int(value, 16) if isinstance(value, str) else int(value)
 
 
 
@@ -47,8 +75,7 @@ class LOOKinRemote:
 	@code
 		from pylookinremote import LOOKinRemote
 		devs = LOOKinRemote.findInNetwork()
-		for dev in devs:
-			meteoSensorMeas = dev.sensor('Meteo')
+		for (dev, meteoSensorMeas) in zip(devs, LOOKinRemote.sensorAll(devs, 'Meteo')):
 			temp_C = meteoSensorMeas['Temperature']
 			temp_F = LOOKinRemote.celsius2Fahrenheit(meteoSensorMeas['Temperature'])
 			humidityRel = meteoSensorMeas['Humidity']
@@ -57,19 +84,67 @@ class LOOKinRemote:
 
 	This generates the output:
 
-		Starting search for available LOOKinRemote devices...
-		...Device Found at 192.168.0.123...
-		...Device Found at 192.168.0.234...
-		...Search complete!  Found 2 LOOKin Remote devices.
 		LOOKinRemote(192.168.0.123) is reporting: 20.7°C/69.3°F and 53.6%RH
 		LOOKinRemote(192.168.0.234) is reporting: 21.0°C/69.8°F and 61.3%RH
+
+	Discovery progress is reported through `logging` at the `INFO` level.
 	"""
 
-	def __init__(self, networkAddress, auxDataFilePath=None):
+	_MAX_CONNECTIONS = 4  #Size of the per-device connection pool and request thread pools.
+	_MAX_DEVICE_WORKERS = 32  #Most threads `sensorAll` uses to poll devices concurrently.
+	_REMOTE_DATA_TTL_SEC = 2.  #How long `remoteData` results are reused before fetching them again.
+	_zeroconf = None  #`zeroconf.Zeroconf` instance shared by `findInNetwork` calls.
+	_discoveryBrowser = None  #`zeroconf.ServiceBrowser` kept running between `findInNetwork` calls.
+	_discoveryListener = None  #`LOOKinRemote._DiscoveryListener` fed by `_discoveryBrowser`.
+	_discoveryLock = threading.Lock()  #Guards creating and closing the discovery objects.
+	_HEADERS = {'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'}  #Sent with every request; urllib3 decodes compressed bodies.
+	_HEADERS_JSON = {**_HEADERS, 'Content-Type': 'application/json'}  #Sent with requests carrying a JSON body.
+	_RETRY = urllib3.Retry(
+		total=3,
+		connect=3,
+		read=0,  #Never resend once the device may have received the request; callers verify and re-issue commands themselves.
+		status=0,  #Same for error replies, which prove the device received it.
+		backoff_factor=0.3,
+		raise_on_status=False,  #Let `_api_request` raise its usual `HTTPError`.
+	)  #Transport-level retries for connections that never reached the device.
+
+	class _DiscoveryListener:
+		"""
+		Collects LOOKin Remote devices announced over mDNS.
+		"""
+		def __init__(self):
+			self.serverAddrs = {}  #Maps `str` mDNS service names to `ipaddress` addresses.
+			self.found = threading.Event()
+			self.timeLastFound = None  #`time.monotonic()` of the last device found.
+		def add_service(self, zeroconf, type, name):
+			info = zeroconf.get_service_info(type, name)
+			if info is None or not info.addresses:
+				return
+			ipAddr = ipaddress.ip_address(info.addresses[0])
+			_logger.info('...Device Found at %s...', ipAddr)
+			self.serverAddrs[name] = ipAddr
+			self.timeLastFound = time.monotonic()
+			self.found.set()
+		def remove_service(self, zeroconf, type, name):
+			self.serverAddrs.pop(name, None)
+		def update_service(self, zeroconf, type, name):
+			info = zeroconf.get_service_info(type, name)
+			if info is not None and info.addresses:
+				self.serverAddrs[name] = ipaddress.ip_address(info.addresses[0])
+
+	def __init__(self, networkAddress, auxDataFilePath=None, connectTimeout_sec=1., readTimeout_sec=10., metaTTL_sec=60.):
 		"""
 		Constructor.  `networkAddress` should be either the IP Address or DNS
 		Address for the target device.
 
+		`connectTimeout_sec` and `readTimeout_sec` bound how long each request
+		waits to connect to the device and for its response, respectively.  The
+		short connect timeout makes an unreachable device fail fast.
+
+		`metaTTL_sec` is how long the device's rarely-changing metadata
+		(available commands, command events, sensors, and network info) is
+		reused before fetching it again.  Use `0` to always fetch it.
+
 		`auxDataFilePath` may be a `str` or `pathlib.Path` object defining a
 		local file to save backup/auxiliary information to, particularly
 		important since function creation doesn't appear to work on LOOKin
@@ -82,6 +157,19 @@ class LOOKinRemote:
 			auxDataFilePath = pathlib.Path(auxDataFilePath)
 		self._address = networkAddress
 		self._auxDataFilePath = auxDataFilePath
+		self._baseUrl = f'http://{self._address}'
+		self._pool = urllib3.connection_from_url(
+			self._baseUrl,
+			maxsize=self._MAX_CONNECTIONS,
+			block=False,
+			headers=self._HEADERS,
+			timeout=urllib3.Timeout(connect=connectTimeout_sec, read=readTimeout_sec),
+			retries=self._RETRY,
+		)  #Keep-alive connections to the device.
+		self._metaCache = {}  #Maps `str` API paths to `(time.monotonic() fetched, data)` tuples.
+		self._metaTTL_sec = metaTTL_sec
+		self._remoteDataCache = {}  #Maps `str` UUIDs to `(time.monotonic() fetched, data)` tuples.
+		self._remotesDataCache = None  #`(time.monotonic() fetched, data)` tuple for "data/", or `None`.
 
 	@staticmethod
 	def celsius2Fahrenheit(temp_C):
@@ -97,11 +185,52 @@ class LOOKinRemote:
 		"""
 		return (float(temp_F) - 32) * 5. / 9.
 
+	def close(self):
+		"""
+		Closes this object's persistent connections to the device.  The object
+		can't make further requests afterwards.  Called automatically when used
+		as a context manager (`with LOOKinRemote(...) as dev:`).
+
+		Also writes any unsaved auxiliary data (see `IRRemote.auxDataFlush()`).
+		"""
+		IRRemote.auxDataFlush()
+		self._pool.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *excInfo):
+		self.close()
+
 	@classmethod
-	def findInNetwork(cls, timeout_sec=10, auxDataFilePath=None):
+	def closeDiscovery(cls):
+		"""
+		Stops the background device discovery started by `findInNetwork`.  This
+		is called automatically at exit.
 		"""
-		Searches the network for `timeout_sec` seconds for available LOOKin
-		Remote devices and returns a list of `LOOKinRemote` objects.
+		with cls._discoveryLock:
+			if cls._discoveryBrowser is not None:
+				cls._discoveryBrowser.cancel()
+				cls._zeroconf.close()
+			cls._discoveryBrowser = None
+			cls._discoveryListener = None
+			cls._zeroconf = None
+		atexit.unregister(cls.closeDiscovery)
+
+	@classmethod
+	def findInNetwork(cls, timeout_sec=10, auxDataFilePath=None, quiet_sec=None, expectedCount=None):
+		"""
+		Searches the network for up to `timeout_sec` seconds for available
+		LOOKin Remote devices and returns a list of `LOOKinRemote` objects.  If
+		`expectedCount` isn't `None`, the search ends as soon as that many devices
+		have been found and `quiet_sec` is ignored.  Otherwise, if `quiet_sec`
+		isn't `None`, the search ends early once devices have been found and no
+		new device has appeared during this call for `quiet_sec` seconds.  By
+		default the search takes the full `timeout_sec`.
+
+		Discovery keeps running in the background after the first call, so
+		repeated calls return the devices seen so far almost immediately.  Use
+		`closeDiscovery` to stop it.
 
 		`auxDataFilePath` will be passed through to any `LOOKinRemote` objects
 		created.
@@ -110,27 +239,91 @@ class LOOKinRemote:
 			from zeroconf import ServiceBrowser, Zeroconf
 		except ImportError:
 			print('`findInNetwork` requires the "zeroconf" library (`pip install zeroconf`).')
-		class Listener:
-			serverAddrs = None
-			def __init__(self):
-				self.serverAddrs = []
-			def add_service(self, zeroconf, type, name):
-				info = zeroconf.get_service_info(type, name)
+			raise
+		_logger.info('Starting search for available LOOKinRemote devices...')
+		with cls._discoveryLock:
+			if cls._discoveryBrowser is None:  #Browses in the background until `closeDiscovery`; later searches start from what it already found.
+				cls._zeroconf = Zeroconf()
+				cls._discoveryListener = cls._DiscoveryListener()
+				cls._discoveryBrowser = ServiceBrowser(cls._zeroconf, '_lookin._tcp.local.', cls._discoveryListener)
+				atexit.register(cls.closeDiscovery)
+			listener = cls._discoveryListener
+		timeStart = time.monotonic()
+		timeStop = timeStart + timeout_sec
+		while expectedCount is None or len(listener.serverAddrs) < expectedCount:
+			timeWake = timeStop
+			if expectedCount is None and quiet_sec is not None and listener.serverAddrs:  #Quiet time counts from this call's start, not from devices found by earlier calls.
+				timeWake = min(timeStop, max(timeStart, listener.timeLastFound) + quiet_sec)
+			timeNow = time.monotonic()
+			if timeNow >= timeWake:
+				break
+			listener.found.wait(timeWake - timeNow)
+			listener.found.clear()
+		serverAddrs = list(listener.serverAddrs.values())
+		_logger.info('...Search complete!  Found %d LOOKin Remote devices.', len(serverAddrs))
+		return [LOOKinRemote(serverAddr, auxDataFilePath) for serverAddr in serverAddrs]
+
+	@classmethod
+	async def findInNetworkAsync(cls, timeout_sec=10, auxDataFilePath=None, quiet_sec=None, expectedCount=None):
+		"""
+		Coroutine version of `findInNetwork` for use inside a running event loop.
+		Discovery runs on the caller's loop through `zeroconf.asyncio`, so
+		searching doesn't tie up a thread.  The parameters and return value are
+		the same as `findInNetwork`.
+		"""
+		try:
+			from zeroconf import ServiceStateChange
+			from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
+		except ImportError:
+			print('`findInNetworkAsync` requires the "zeroconf" library (`pip install zeroconf`).')
+			raise
+		loop = asyncio.get_running_loop()
+		serverAddrs = []
+		found = asyncio.Event()
+		timeLastFound = None  #`loop.time()` of the last device found.
+		tasks = set()  #Keeps pending lookups referenced until they finish.
+		async def serviceResolve(zeroconf, serviceType, name):
+			nonlocal timeLastFound
+			info = AsyncServiceInfo(serviceType, name)
+			if await info.async_request(zeroconf, 3000) and info.addresses:
 				ipAddr = ipaddress.ip_address(info.addresses[0])
-				print(f'...Device Found at {ipAddr!s}...')
-				self.serverAddrs.append(ipAddr)
-			def remove_service(self, *args, **kargs):
-				pass
-			def update_service(self, *args, **kargs):
-				pass
-		zeroconf = Zeroconf()
-		listener = Listener()
-		print('Starting search for available LOOKinRemote devices...')
-		serverBrowser = ServiceBrowser(zeroconf, '_lookin._tcp.local.', listener)
-		time.sleep(timeout_sec)
-		zeroconf.close()
-		print(f'...Search complete!  Found {len(listener.serverAddrs)} LOOKin Remote devices.')
-		return [LOOKinRemote(serverAddr, auxDataFilePath) for serverAddr in listener.serverAddrs]
+				_logger.info('...Device Found at %s...', ipAddr)
+				serverAddrs.append(ipAddr)
+				timeLastFound = loop.time()
+				found.set()
+		def onServiceStateChange(zeroconf, service_type, name, state_change):
+			if state_change is ServiceStateChange.Added:
+				task = loop.create_task(serviceResolve(zeroconf, service_type, name))
+				tasks.add(task)
+				task.add_done_callback(tasks.discard)
+		asyncZeroconf = AsyncZeroconf()
+		_logger.info('Starting search for available LOOKinRemote devices...')
+		serverBrowser = AsyncServiceBrowser(
+			asyncZeroconf.zeroconf,
+			'_lookin._tcp.local.',
+			handlers=[onServiceStateChange],
+		)
+		try:
+			timeStop = loop.time() + timeout_sec
+			while expectedCount is None or len(serverAddrs) < expectedCount:
+				timeWake = timeStop
+				if expectedCount is None and quiet_sec is not None and timeLastFound is not None:
+					timeWake = min(timeStop, timeLastFound + quiet_sec)
+				timeNow = loop.time()
+				if timeNow >= timeWake:
+					break
+				try:
+					await asyncio.wait_for(found.wait(), timeWake - timeNow)
+				except asyncio.TimeoutError:
+					pass
+				found.clear()
+		finally:
+			await serverBrowser.async_cancel()
+			for task in tasks:
+				task.cancel()
+			await asyncZeroconf.async_close()
+		_logger.info('...Search complete!  Found %d LOOKin Remote devices.', len(serverAddrs))
+		return [LOOKinRemote(serverAddr, auxDataFilePath) for serverAddr in serverAddrs]
 
 	def api_commands_command_GET(self, command):
 		"""
@@ -154,26 +347,26 @@ class LOOKinRemote:
 		saved             	0xEE     	Send command from device memory               	Storage item ID
 		sony              	0x03     	Send Sony command on 38 kHz                   	command
 		"""
-		return json.loads(self._api_get(f'commands/{urllib.parse.quote(command)}'))
+		return self._api_getJSONCached(f'commands/{_quote(command)}')
 
 	def api_commands_GET(self):
 		"""
 		API call.  Returns the remote's available command classes.
 		"""
-		return json.loads(self._api_get('commands'))
+		return self._api_getJSONCached('commands')
 
 	def api_commands_ir_localremote_GET(self, uuid, functionCode, signalID=0xFF):
 		"""
 		Triggers a "localremote" command event with `functionCode` and `signalID`.
 
-		`uuid` should be a `str` or 16-bit `int`.
-		`functionCode` should be a `str` or 8-bit `int`.
-		`signalID` should be a `str` or 8-bit `int`.
+		`uuid` should be a hex `str` or 16-bit `int`.
+		`functionCode` should be a hex `str` or 8-bit `int`.
+		`signalID` should be a hex `str` or 8-bit `int`.
 		"""
-		uuid = hex(0xFFFF & int(signal))[2:].upper()
-		functionCode = hex(0xFF & int(functionCode))[2:].upper()
-		signalID = hex(0xFF & int(signalID))[2:].upper()
-		return json.loads(self._api_get(f'commands/ir/localremote/{uuid}{functionCode}{signalID}'))
+		uuid = format(_hexInt(uuid) & 0xFFFF, '04X')  #Fixed widths, since the fields are concatenated.
+		functionCode = format(_hexInt(functionCode) & 0xFF, '02X')
+		signalID = format(_hexInt(signalID) & 0xFF, '02X')
+		return self._api_getJSON(f'commands/ir/localremote/{uuid}{functionCode}{signalID}')
 
 	def api_commands_ir_nec1_signal_GET(self, signal):
 		"""
@@ -181,8 +374,8 @@ class LOOKinRemote:
 
 		`signal` should be a hex string or 32-bit `int`.
 		"""
-		signal = hex(0xFFFFFFFF & int(signal))[2:].upper()
-		return json.loads(self._api_get(f'commands/ir/nec1/{signal}'))
+		signal = format(_hexInt(signal) & 0xFFFFFFFF, '08X')
+		return self._api_getJSON(f'commands/ir/nec1/{signal}')
 
 	def api_commands_ir_necx_GET(self, signal):
 		"""
@@ -190,8 +383,8 @@ class LOOKinRemote:
 
 		`signal` should be a hex string or 32-bit `int`.
 		"""
-		signal = hex(0xFFFFFFFF & int(signal))[2:]
-		return json.loads(self._api_get(f'commands/ir/necx/{signal}'))
+		signal = format(_hexInt(signal) & 0xFFFFFFFF, '08X')
+		return self._api_getJSON(f'commands/ir/necx/{signal}')
 
 	def api_commands_ir_prontohex_GET(self, signal):
 		"""
@@ -201,8 +394,9 @@ class LOOKinRemote:
 		iterable of 16-bit `int`s (e.g. `[0x0000, 0x006C, 0x0022, 0x0002]`).
 		"""
 		if not isinstance(signal, str):  #Assume it's an iterable.
-			signal = ' '.join(hex(0xFFFF & x)[2:].upper() for x in signal)
-		return json.loads(self._api_get(f'commands/ir/prontohex/{urllib.parse.quote(signal)}'))
+			words = [x & 0xFFFF for x in signal]
+			signal = struct.pack(f'>{len(words)}H', *words).hex(' ', 2).upper()  #Formats every word in one C-level pass.
+		return self._api_getJSON(f'commands/ir/prontohex/{urllib.parse.quote(signal)}')
 
 	def api_commands_ir_raw_GET(self, signal, freqCarrier_Hz=38000):
 		"""
@@ -216,8 +410,8 @@ class LOOKinRemote:
 		`freqCarrier_Hz` defines the carrier frequency of `signal`.
 		"""
 		if not isinstance(signal, str):  #Assume it's an iterable.
-			signal = ' '.join(str(x) for x in signal)
-		return json.loads(self._api_get(f'commands/ir/raw/{freqCarrier_Hz};{urllib.parse.quote(signal)}'))
+			signal = ' '.join(map(str, signal))
+		return self._api_getJSON(f'commands/ir/raw/{freqCarrier_Hz};{urllib.parse.quote(signal)}')
 
 	def api_commands_ir_saved_GET(self, signalID):
 		"""
@@ -226,7 +420,7 @@ class LOOKinRemote:
 		`signalID` should be a `str` or `int`.
 		"""
 		signalID = str(int(signalID))
-		return json.loads(self._api_get(f'commands/ir/saved/{signalID}'))
+		return self._api_getJSON(f'commands/ir/saved/{signalID}')
 
 	def api_data_DEL(self, *, yesIWantToDoThis=False):
 		"""
@@ -234,13 +428,15 @@ class LOOKinRemote:
 		call this!
 		"""
 		assert yesIWantToDoThis, f'Keyword argument `yesIWantToDoThis=True` is required to execute this method.'
+		self._remoteDataCache.clear()
+		self._remotesDataCache = None
 		return self._api_del(f'data/')
 
 	def api_data_GET(self):
 		"""
 		Returns the general data for all saved remotes.
 		"""
-		return json.loads(self._api_get('data'))
+		return self._api_getJSON('data')
 
 	def api_data_POST(self, name, irRemoteType, extra, uuid, updated):
 		"""
@@ -251,6 +447,7 @@ class LOOKinRemote:
 
 		If `uuid` is `None`, a random one will be generated for you.
 		"""
+		self._remotesDataCache = None
 		return self._api_post(
 			'data',
 			Type=irRemoteType,
@@ -264,6 +461,8 @@ class LOOKinRemote:
 		"""
 		Deletes the IR remote `uuid` from the device.
 		"""
+		self._remoteDataCache.pop(uuid, None)
+		self._remotesDataCache = None
 		return self._api_del(f'data/{uuid}')
 
 	def api_data_uuid_function_DEL(self, uuid, functionName):
@@ -271,13 +470,14 @@ class LOOKinRemote:
 		Deletes the function `functionName` from the IR remote `uuid` on the
 		device.
 		"""
-		return self._api_del(f'data/{uuid}/{urllib.parse.quote(functionName)}')
+		self._remoteDataCache.pop(uuid, None)
+		return self._api_del(f'data/{uuid}/{_quote(functionName)}')
 
 	def api_data_uuid_function_GET(self, uuid, functionName):
 		"""
 		Returns the data for `functionName` of the IR remote `uuid`.
 		"""
-		return json.loads(self._api_get(f'data/{uuid}/{urllib.parse.quote(functionName)}'))
+		return self._api_getJSON(f'data/{uuid}/{_quote(functionName)}')
 
 	def api_data_uuid_function_POST(self, uuid, functionName, functionType, signals):
 		"""
@@ -289,8 +489,9 @@ class LOOKinRemote:
 
 		For more information, see:  https://www.reddit.com/r/homeautomation/comments/kqaggm/
 		"""
+		self._remoteDataCache.pop(uuid, None)
 		return self._api_post(
-			f'data/{uuid}/{urllib.parse.quote(functionName)}',
+			f'data/{uuid}/{_quote(functionName)}',
 			type=functionType,
 			signals=signals,
 		)
@@ -318,14 +519,15 @@ class LOOKinRemote:
 			kargs['type'] = functionType
 		if signals is not None:
 			kargs['signals'] = signals
+		self._remoteDataCache.pop(uuid, None)
 		return self._api_put(
-			f'data/{uuid}/{urllib.parse.quote(functionName)}', **kargs)
+			f'data/{uuid}/{_quote(functionName)}', **kargs)
 
 	def api_data_uuid_GET(self, uuid):
 		"""
 		Returns the data specific to the saved IR remote with the given `uuid`.
 		"""
-		return json.loads(self._api_get(f'data/{uuid}'))
+		return self._api_getJSON(f'data/{uuid}')
 
 	def api_data_uuid_PUT(self, uuid, updated, name=None, irRemoteType=None, extra=None):
 		"""
@@ -340,30 +542,21 @@ class LOOKinRemote:
 			kargs['Type'] = irRemoteType
 		if extra is not None:
 			kargs['Extra'] = extra
+		self._remoteDataCache.pop(uuid, None)
+		self._remotesDataCache = None
 		return self._api_put(f'data/{uuid}', **kargs)
 
 	def _api_del(self, path):
 		"""
-		Issues GET request to API with `path`.  `kargs` will be added as parameters.
-		"""
-		url = urllib.parse.SplitResult(
-			'http',
-			self._address,
-			path,
-			'',
-			'',
-		).geturl()
-		resp = urllib.request.urlopen(urllib.request.Request(
-			url,
-			method='DEL'
-		), timeout=10)
-		return resp.read()
+		Issues DELETE request to API with `path`.
+		"""
+		return self._api_request('DELETE', path)
 
 	def api_device_GET(self):
 		"""
 		API call.  Returns the "device" information.
 		"""
-		return json.loads(self._api_get('device'))
+		return self._api_getJSON('device')
 
 	def api_device_POST(
 			self,
@@ -378,32 +571,31 @@ class LOOKinRemote:
 		API call.  Sets the "device" values.  `None` parameters will be
 		excluded.
 		"""
-		kargs = {}
-		if name is not None:
-			kargs['Name'] = name
-		if timeVal is not None:
-			kargs['Time'] = timeVal
-		if timezone is not None:
-			kargs['Timezone'] = timezone
-		if sensormode is not None:
-			kargs['SensorMode'] = sensormode
-		if bluetoothmode is not None:
-			kargs['BluetoothMode'] = bluetoothmode
-		# if firmware is not None:  #This should only be modified by official software.
-			# kargs['firmware'] = firmware  #This should only be modified by official software.
+		kargs = {
+			key: val for (key, val) in (
+				('Name', name),
+				('Time', timeVal),
+				('Timezone', timezone),
+				('SensorMode', sensormode),
+				('BluetoothMode', bluetoothmode),
+				# ('firmware', firmware),  #This should only be modified by official software.
+			) if val is not None
+		}
+		expected = tuple(kargs.items())
+		def isMatch(deviceInfo):
+			return isinstance(deviceInfo, dict) and all(deviceInfo.get(key) == valExp for (key, valExp) in expected)
+		self._metaCache.clear()  #E.g. the sensor mode affects the available sensors.
 		retries = 5
 		for tryNum in range(retries):
 			resp = self._api_post('device', **kargs)
-			timeout = time.time() + 30
-			while(time.time() < timeout):
-				time.sleep(5)  #The command takes a few seconds to process even when it works well.
-				deviceInfo = self.api_device_GET()
-				for (key, valExp) in kargs.items():
-					if deviceInfo.get(key) != valExp:
-						break
-				else:
+			try:
+				if isMatch(_jsonLoads(resp)):  #Device echoed the applied settings; no need to poll.
 					return
-			print(f'Timed Out Attempt {tryNum + 1} of {retries}...')
+			except ValueError:  #Not JSON.
+				pass
+			if self._pollUntil(lambda: isMatch(self.api_device_GET())):
+				return
+			_logger.warning('Timed Out Attempt %d of %d...', tryNum + 1, retries)
 		else:
 			raise TimeoutError(f'FAILED to set device parameters!')
 
@@ -412,16 +604,29 @@ class LOOKinRemote:
 		Issues GET request to API with `path`.  `kargs` will be added as
 		parameters.
 		"""
-		url = urllib.parse.SplitResult(
-			'http',
-			self._address,
-			path,
-			urllib.parse.urlencode(kargs),
-			'',
-		).geturl()
-		print(f'_get - url={url!r}')
-		resp = urllib.request.urlopen(url, timeout=5)
-		return resp.read()
+		if kargs:
+			path = f'{path}?{urllib.parse.urlencode(kargs)}'
+		_logger.debug('_get - url=%s/%s', self._baseUrl, path)
+		return self._api_request('GET', path)
+
+	def _api_getJSON(self, path, **kargs):
+		"""
+		Issues GET request to API with `path` and returns the decoded JSON
+		response.  The pool's response bytes are handed straight to the JSON
+		parser without an intermediate `str`.
+		"""
+		return _jsonLoads(self._api_get(path, **kargs))
+
+	def _api_getJSONCached(self, path):
+		"""
+		Same as `_api_getJSON`, but reuses the response for `_metaTTL_sec`
+		seconds.  Only for metadata that rarely changes.
+		"""
+		cached = self._metaCache.get(path)
+		if cached is None or time.monotonic() - cached[0] >= self._metaTTL_sec:
+			cached = (time.monotonic(), self._api_getJSON(path))
+			self._metaCache[path] = cached
+		return cached[1]
 
 	def api_network_connect_GET(self, ssid=None):
 		"""
@@ -431,52 +636,55 @@ class LOOKinRemote:
 		kargs = {}
 		if (ssid is not None):
 			kargs['ssid'] = ssid
-		return json.loads(self._api_get('network/connect', **kargs))
+		self._metaCache.clear()
+		return self._api_getJSON('network/connect', **kargs)
 
 	def api_network_GET(self):
 		"""
 		API call.  Returns the device's network information.
 		"""
-		return json.loads(self._api_get('network'))
+		return self._api_getJSONCached('network')
 
 	def api_network_keepwifi_GET(self):
 		"""
 		API call.  Tells the remote to keep the WiFi connection while
 		"sensor mode" is on.
 		"""
-		return json.loads(self._api_get('network/keepwifi'))
+		return self._api_getJSON('network/keepwifi')
 
 	def api_network_POST(self, ssid, password):
 		"""
 		API call.  Adds the network `ssid` and `password` to the remote's
 		internal list of supported WiFi hotspots.
 		"""
-		return json.loads(self._api_post('network', WiFiSSID=ssid, WiFiPassword=password))
+		self._metaCache.clear()
+		return _jsonLoads(self._api_post('network', WiFiSSID=ssid, WiFiPassword=password))
 
 	def api_network_remotecontrol_GET(self):
 		"""
 		API call.  Fetches the remote's RemoteControl state.
 		"""
-		return json.loads(self._api_get('network/remotecontrol'))
+		return self._api_getJSON('network/remotecontrol')
 
 	def api_network_remotecontrol_reconnect_GET(self):
 		"""
 		API call.  Tells the remote to use the "reconnect" RemoteControl state.
 		"""
-		return json.loads(self._api_get('network/remotecontrol/reconnect'))
+		return self._api_getJSON('network/remotecontrol/reconnect')
 
 	def api_network_remotecontrol_stop_GET(self):
 		"""
 		API call.  Tells the remote to use the "stop" RemoteControl state.
 		"""
-		return json.loads(self._api_get('network/remotecontrol/stop'))
+		return self._api_getJSON('network/remotecontrol/stop')
 
 	def api_network_savedssid_DEL(self, ssid):
 		"""
 		API call.  Deletes the network `ssid` from the remote's internal list of
 		supported WiFi hotspots.
 		"""
-		return self._api_del(f'network/savedssid/{urllib.parse.quote(ssid)}')
+		self._metaCache.clear()
+		return self._api_del(f'network/savedssid/{_quote(ssid)}')
 
 	def api_network_SavedSSID_GET(self):
 		"""
@@ -484,14 +692,14 @@ class LOOKinRemote:
 
 		Use `api_network_POST` and `api_network_savedssid_DEL` to modify this list.
 		"""
-		return json.loads(self._api_get('network/SavedSSID'))
+		return self._api_getJSONCached('network/SavedSSID')
 
 	def api_network_scannedssidlist_GET(self):
 		"""
 		API call.  Returns the network SSIDs the device found last time it
 		booted up.
 		"""
-		return json.loads(self._api_get('network/scannedssidlist'))
+		return self._api_getJSON('network/scannedssidlist')
 
 	def _api_post(self, path, **kargs):
 		"""
@@ -499,58 +707,48 @@ class LOOKinRemote:
 		a JSON document.
 		"""
 		# print(f'POST to {path!r} with parameters {kargs!r}')
-		url = urllib.parse.SplitResult(
-			'http',
-			self._address,
-			path,
-			'',
-			'',
-		).geturl()
-		resp = urllib.request.urlopen(
-			url,
-			json.dumps(kargs).encode(),
-			timeout=10,
-		)
-		return resp.read()
+		return self._api_request('POST', path, body=_jsonDumps(kargs), headers=self._HEADERS_JSON)
 
 	def _api_put(self, path, **kargs):
 		"""
 		Issues PUT request to API with `path`.  `kargs` will be transmitted as a
 		JSON document.
 		"""
-		url = urllib.parse.SplitResult(
-			'http',
-			self._address,
-			path,
-			'',
-			'',
-		).geturl()
-		resp = urllib.request.urlopen(urllib.request.Request(
-			url,
-			json.dumps(kargs).encode(),
-			method='PUT'
-		), timeout=10)
-		return resp.read()
+		return self._api_request('PUT', path, body=_jsonDumps(kargs), headers=self._HEADERS_JSON)
+
+	def _api_request(self, method, path, **kargs):
+		"""
+		Issues a `method` request to API with `path` through this object's
+		persistent connection pool and returns the response body.  `kargs` are
+		passed through to `urllib3.HTTPConnectionPool.request`.
+
+		Raises `urllib.error.HTTPError` on error responses, same as
+		`urllib.request.urlopen` does.
+		"""
+		resp = self._pool.request(method, f'/{path}', **kargs)
+		if resp.status >= 400:
+			raise urllib.error.HTTPError(f'{self._baseUrl}/{path}', resp.status, resp.reason, resp.headers, None)
+		return resp.data
 
 	def api_sensors_GET(self):
 		"""
 		API call.  Returns the remote's available sensors.
 		"""
-		return json.loads(self._api_get('sensors'))
+		return self._api_getJSONCached('sensors')
 
 	def api_sensors_sensor_GET(self, name):
 		"""
 		API call.  Returns the information for sensor named `name` on the remote.
 		"""
-		return json.loads(self._api_get(f'sensors/{urllib.parse.quote(name)}'))
+		return self._api_getJSON(f'sensors/{_quote(name)}')
 
 	def commandEventLocalRemote(self, uuid, functionCode, signalID=0xFF):
 		"""
 		Triggers a "localremote" command event with `functionCode` and `signalID`.
 
-		`uuid` should be a `str` or 16-bit `int`.
-		`functionCode` should be a `str` or 8-bit `int`.
-		`signalID` should be a `str` or 8-bit `int`.
+		`uuid` should be a hex `str` or 16-bit `int`.
+		`functionCode` should be a hex `str` or 8-bit `int`.
+		`signalID` should be a hex `str` or 8-bit `int`.
 		"""
 		return self.api_commands_ir_localremote_GET(uuid, functionCode, signalID)
 
@@ -616,6 +814,16 @@ class LOOKinRemote:
 		"""
 		return self.api_commands_command_GET(command)
 
+	def commandEventsAll(self):
+		"""
+		Returns a `dict` mapping each of the remote's command classes to its
+		available events (see `commandEvents`).  The per-command requests are
+		issued concurrently.
+		"""
+		commands = self.commands()
+		with ThreadPoolExecutor(max_workers=self._MAX_CONNECTIONS) as executor:
+			return dict(zip(commands, executor.map(self.commandEvents, commands)))
+
 	def commandEventSaved(self, signalID):
 		"""
 		Triggers a "saved" command event with `signalID`.
@@ -630,6 +838,26 @@ class LOOKinRemote:
 		"""
 		return self.api_commands_GET()
 
+	@staticmethod
+	def _pollUntil(isDone, timeout_sec=30, delay_sec=0.25, delayMax_sec=5.):
+		"""
+		Calls `isDone` with exponential backoff until it returns true (returns
+		`True`) or `timeout_sec` seconds pass (returns `False`).  The delay
+		starts at `delay_sec` and doubles after every poll up to `delayMax_sec`.
+		Network errors count as a failed poll, since devices tend to drop
+		connections while busy processing a command.
+		"""
+		timeStop = time.monotonic() + timeout_sec
+		while time.monotonic() < timeStop:
+			time.sleep(delay_sec)  #The command takes a moment to process even when it works well.
+			delay_sec = min(delay_sec * 2, delayMax_sec)
+			try:
+				if isDone():
+					return True
+			except (ConnectionResetError, socket.timeout, urllib.error.URLError, urllib3.exceptions.HTTPError) as ex:
+				_logger.warning('Error while polling device: %r', ex)
+		return False
+
 	def remoteCreate(self, name, irRemoteType, extra='', uuid=None):
 		"""
 		Creates a new IR remote definition on the device.
@@ -645,71 +873,99 @@ class LOOKinRemote:
 			irRemoteType = IRRemote.TYPE[irRemoteType]
 		elif isinstance(irRemoteType, int):
 			irRemoteType = IRRemote.TYPE(irRemoteType)
-		uuids = []
-		for remoteData in self.remotesData():
-			uuids.append(remoteData['UUID'])
+		uuids = self.remotesDataByUUID()
 		if uuid is None:  #Generate one automatically.
-			randUUID = lambda: ''.join(random.choices('0123456789ABCDEF', k=4))
-			while True:
+			randUUID = lambda: secrets.token_hex(2).upper()
+			uuid = randUUID()
+			while uuid in uuids:
 				uuid = randUUID()
-				if uuid in uuids:
-					continue
-				break
 		if uuid in uuids:
 			raise ValueError(f'Given IR Remote UUID {uuid!r} already exists on the remote.')
 		return self.api_data_POST(
 			name,
-			hex(irRemoteType.value)[2:].upper(),
+			f'{irRemoteType.value:X}',
 			extra,
 			uuid,
 			str(time.time()),
 		)
 
+	def remoteData(self, uuid, refresh=False):
+		"""
+		Returns the data specific to the saved IR remote with the given `uuid`.
+
+		Data fetched within the last `_REMOTE_DATA_TTL_SEC` seconds is reused
+		unless `refresh` is true.  Changes made through this object discard the
+		reused data.
+		"""
+		cached = self._remoteDataCache.get(uuid)
+		if refresh or cached is None or time.monotonic() - cached[0] > self._REMOTE_DATA_TTL_SEC:
+			cached = (time.monotonic(), self.api_data_uuid_GET(uuid))
+			self._remoteDataCache[uuid] = cached
+		return cached[1]
+
+	def remoteDataInvalidate(self, uuid):
+		"""
+		Discards the reused data for the saved IR remote with the given `uuid`,
+		so the next `remoteData` call fetches it from the device.
+		"""
+		self._remoteDataCache.pop(uuid, None)
+
 	def remoteFromUUID(self, uuid):
 		"""
 		Returns a new `IRRemote` object for the remote matching `uuid`.
 		"""
-		remotes = self.remotes()
-		for remote in remotes:
-			if remote.uuid == uuid:
-				return remote
-		raise ValueError(f'FAILED to find remote matching UUID {uuid!r}.')
+		rootData = self.remotesDataByUUID().get(uuid)
+		if rootData is None:
+			raise ValueError(f'FAILED to find remote matching UUID {uuid!r}.')
+		return self._remoteGet(rootData)
 
 	def _remoteGet(self, rootData):
 		"""
 		Returns the appropriate `IRRemote` object for the given data.
 		`rootData` is the remote's data from "data/".
 		"""
-		typeID = rootData['Type']
-		ret = None
-		if typeID == 'EF':
-			ret = ACRemote(self, rootData["UUID"], rootData)
-		else:
-			ret = IRRemote(self, rootData["UUID"], rootData)
-		return ret
+		remoteClass = _REMOTE_CLASS_BY_TYPE.get(rootData['Type'], IRRemote)
+		return remoteClass(self, rootData["UUID"], rootData)
 
 	def remotes(self):
 		"""
 		Returns the remote's saved IR remotes.
+
+		Each remote's data is fetched concurrently.
 		"""
-		remotes = []
-		for rootData in self.remotesData():
-			remotes.append(self._remoteGet(rootData))
-		return remotes
+		with ThreadPoolExecutor(max_workers=self._MAX_CONNECTIONS) as executor:
+			return list(executor.map(self._remoteGet, self.remotesData()))
 
-	def remotesData(self):
+	def remotesData(self, refresh=False):
 		"""
 		Returns the general data for all saved remotes.
+
+		Data fetched within the last `_REMOTE_DATA_TTL_SEC` seconds is reused
+		unless `refresh` is true.  Changes made through this object discard the
+		reused data.
 		"""
-		return self.api_data_GET()
+		cached = self._remotesDataCache
+		if refresh or cached is None or time.monotonic() - cached[0] > self._REMOTE_DATA_TTL_SEC:
+			cached = (time.monotonic(), self.api_data_GET())
+			self._remotesDataCache = cached
+		return cached[1]
+
+	def remotesDataByUUID(self, refresh=False):
+		"""
+		Returns `remotesData()` as a `dict` mapping each remote's UUID to its
+		general data.
+		"""
+		return {rootData['UUID']: rootData for rootData in self.remotesData(refresh)}
 
 	def remotesDelete(self, uuids):
 		"""
 		Deletes the IR remotes `uuids` from the device.
 
-		`uuids` should be an iterable of `str` objects.
+		`uuids` should be an iterable of `str` objects.  The deletes are issued
+		concurrently.
 		"""
-		return [self.remoteDelete(uuid) for uuid in uuids]
+		with ThreadPoolExecutor(max_workers=self._MAX_CONNECTIONS) as executor:
+			return list(executor.map(self.api_data_uuid_DEL, uuids))
 
 	def remotesDeleteAll(self, *, yesIWantToDoThis=False):
 		"""
@@ -729,6 +985,19 @@ class LOOKinRemote:
 		"""
 		return self.api_sensors_sensor_GET(name)
 
+	@classmethod
+	def sensorAll(cls, devs, name):
+		"""
+		Reads sensor `name` from every `LOOKinRemote` in `devs` concurrently and
+		returns the results in the same order as `devs`.  Each device's
+		connection pool is thread-safe, so the workers reuse its connections.
+		"""
+		devs = list(devs)
+		if not devs:
+			return []
+		with ThreadPoolExecutor(max_workers=min(cls._MAX_DEVICE_WORKERS, len(devs))) as executor:
+			return list(executor.map(lambda dev: dev.sensor(name), devs))
+
 	def sensorDump(self, name, period, duration, maxSignals=None):
 		"""
 		Polls the `name` sensor for `duration` seconds and `period` seconds
@@ -741,32 +1010,38 @@ class LOOKinRemote:
 		Returns a `list` of data for all the non-empty captures (only "IR"
 		sensor supported right now).
 		"""
-		print(f'Running sensor dump for {duration} seconds...')
+		_logger.info('Running sensor dump for %s seconds...', duration)
 		signals = []
-		timeStop = time.time() + duration
-		timeNext = 0
-		while time.time() < timeStop:
+		path = f'sensors/{_quote(name)}'  #Same request as `sensor(name)`, built once.
+		period_ns = max(0, int(period * 1e9))
+		timeNow_ns = time.monotonic_ns()
+		timeStop_ns = timeNow_ns + int(duration * 1e9)
+		timeNext_ns = timeNow_ns
+		updatedLast = None  #"Updated" value of the last captured signal, to skip repeats.
+		while timeNow_ns < timeStop_ns:
 			sensorData = None
-			if time.time() > timeNext:
-				if period > 0:
-					timeNext = time.time() + period  #BEFORE calling so duration of call is included.
+			if timeNow_ns >= timeNext_ns:
+				timeNext_ns = timeNow_ns + period_ns  #BEFORE calling so duration of call is included.
 				try:
-					sensorData = self.sensor(name)
-				except (ConnectionResetError, socket.timeout, urllib.error.URLError):
-					print('Connection Reset!  The device might be restarting due to a crash.')
+					sensorData = self._api_getJSON(path)
+				except (ConnectionResetError, socket.timeout, urllib.error.URLError, urllib3.exceptions.HTTPError):
+					_logger.warning('Connection Reset!  The device might be restarting due to a crash.')
 				if (
 						sensorData is not None
 						and name == 'IR'
 						and sensorData.get('Raw', '') != ''
-						and (len(signals) == 0 or signals[-1].get('Updated') != sensorData.get('Updated'))
+						and (len(signals) == 0 or sensorData.get('Updated') != updatedLast)
 				):
+					updatedLast = sensorData.get('Updated')
 					signals.append(sensorData)
-					print(sensorData)
+					_logger.info('Sensor %r captured %r', name, sensorData)
 			if maxSignals is not None and len(signals) >= maxSignals:
 				break
-			if period > 0:
-				time.sleep(max(0, time.time() - timeNext))
-		print(f'...Sensor dump finished.  {len(signals)} signals detected.')
+			sleep_ns = timeNext_ns - time.monotonic_ns()
+			if sleep_ns > 0:
+				time.sleep(sleep_ns / 1e9)
+			timeNow_ns = time.monotonic_ns()
+		_logger.info('...Sensor dump finished.  %d signals detected.', len(signals))
 		return signals
 
 	def sensorNames(self):
@@ -780,11 +1055,18 @@ class LOOKinRemote:
 
 class IRRemote:
 
-	uuid = None  #`str` UUID of the remote.
-	name = None  #`str` name of the remote.
-	rType = None  #Value from `IRRemote.TYPE`.
-	updated = None  #`datetime.datetime` object.
-	functions = None  #`dict` mapping `str` function names to `IRRemoteFunction` objects.
+	__slots__ = (
+		'_auxDataFilePath',
+		'_batchDepth',  #Number of open `batch` blocks.
+		'_lookinRemote',
+		'_remoteData',
+		'_rootData',
+		'_updated',  #Cache for `updated`.
+		'uuid',  #`str` UUID of the remote.
+		'name',  #`str` name of the remote.
+		'rType',  #Value from `IRRemote.TYPE`.
+		'functions',  #`dict` mapping `str` function names to `IRRemoteFunction` objects.
+	)
 
 	class TYPE(Enum):
 		CUSTOM = 0x00
@@ -797,6 +1079,14 @@ class IRRemote:
 		DATADEVICEFAN = 0x07
 		AIRCONDITIONER = 0xEF
 
+	_TYPE_BY_HEX = {f'{rType.value:X}': rType for rType in TYPE}  #Keyed the way `remoteCreate` writes "Type".
+
+	_auxDataCache = {}  #Maps resolved aux data file `pathlib.Path` objects to their loaded data.
+	_auxDataDirty = set()  #Resolved aux data file paths with unsaved changes.
+	_AUX_DATA_FLUSH_DELAY_SEC = 1.  #Saves within this window are written to disk together.
+	_auxDataLock = threading.Lock()  #Guards `_auxDataCache`, `_auxDataDirty` and `_auxDataTimer`; remotes load concurrently.
+	_auxDataTimer = None  #Pending `threading.Timer` for `auxDataFlush`, if any.
+
 	def __init__(self, lookinRemote, uuid, rootData=None, auxDataFilePath=None):
 		"""
 		Constructor initializing the object.  `lookinRemote` is a `LOOKinRemote`
@@ -814,10 +1104,8 @@ class IRRemote:
 		file.
 		"""
 		if rootData is None:
-			for rootData in lookinRemote.remotesData():
-				if rootData["UUID"] == uuid:
-					break
-			else:
+			rootData = lookinRemote.remotesDataByUUID().get(uuid)
+			if rootData is None:
 				raise ValueError(
 					f'Failed to find remote with UUID {uuid!r} on the device.',
 				)
@@ -830,42 +1118,64 @@ class IRRemote:
 		self._lookinRemote = lookinRemote  #BEFORE `_remoteDataRefresh` call.
 		self.functions = {}
 		self.uuid = self._rootData['UUID']  #BEFORE `_remoteDataRefresh` call.
+		self._batchDepth = 0  #BEFORE `_remoteDataRefresh` call.
 		self._remoteDataRefresh()
 		self.name = self._remoteData['Name']
-		self.rType = IRRemote.TYPE(int(self._rootData['Type'], 16))
-		self.updated = datetime.datetime.fromtimestamp(
-			int(self._rootData['Updated']),
-			datetime.timezone.utc,
-		)
-		self._functionsRefresh()
+		typeHex = self._rootData['Type']
+		self.rType = IRRemote._TYPE_BY_HEX.get(typeHex.upper()) or IRRemote.TYPE(int(typeHex, 16))  #Enum call handles zero-padded IDs.
+		self._updated = None
+
+	@classmethod
+	def auxDataFlush(cls):
+		"""
+		Writes any unsaved auxiliary data to the auxiliary data files.  Called
+		automatically `_AUX_DATA_FLUSH_DELAY_SEC` seconds after a save, at exit,
+		and by `LOOKinRemote.close()`.
+		"""
+		with cls._auxDataLock:
+			if IRRemote._auxDataTimer is not None:  #Set on `IRRemote` so subclasses share it.
+				IRRemote._auxDataTimer.cancel()  #No-op when called by the timer itself.
+				IRRemote._auxDataTimer = None
+			for path in cls._auxDataDirty:
+				with path.open('w') as fdWO:
+					json.dump(cls._auxDataCache[path], fdWO, sort_keys=True, indent=4)
+			cls._auxDataDirty.clear()
 
 	def _auxDataLoad(self):
 		"""
-		Returns the data from the auxiliary data file.
+		Returns the data from the auxiliary data file.  The file is only read
+		the first time; later calls return the same in-memory data, including
+		unsaved changes.
 		"""
-		ret = None
-		if self._auxDataFilePath is not None and self._auxDataFilePath.exists():
-			with self._auxDataFilePath.open('r') as fdRO:
-				ret = json.load(fdRO)
-		if ret is None:
-			ret = {}
-		return ret;
+		if self._auxDataFilePath is None:
+			return {}
+		path = self._auxDataFilePath.resolve()
+		with self._auxDataLock:
+			ret = self._auxDataCache.get(path)
+			if ret is None:
+				if path.exists():
+					with path.open('r') as fdRO:
+						ret = json.load(fdRO)
+				if ret is None:
+					ret = {}
+				self._auxDataCache[path] = ret
+		return ret
 
 	def _auxDataSave(self):
 		"""
-		Saves data about this object to the auxiliary data file.
+		Saves data about this object to the auxiliary data file.  The change is
+		kept in memory and written by `auxDataFlush()` shortly after, so a burst
+		of saves costs one write.
 		"""
 		if self._auxDataFilePath is not None:
-			jsonData = None
-			if self._auxDataFilePath.exists():
-				with self._auxDataFilePath.open('r') as fdRO:
-					jsonData = json.load(fdRO)
-			if jsonData is None:
-				jsonData = {}
-			jsonData.setdefault('remotes', {})
-			jsonData['remotes'][self.uuid] = self.toJSON()
-			with self._auxDataFilePath.open('w') as fdWO:
-				json.dump(jsonData, fdWO, sort_keys=True, indent=4)
+			jsonData = self._auxDataLoad()
+			with self._auxDataLock:
+				jsonData.setdefault('remotes', {})[self.uuid] = self.toJSON()
+				self._auxDataDirty.add(self._auxDataFilePath.resolve())
+				if IRRemote._auxDataTimer is None:
+					IRRemote._auxDataTimer = threading.Timer(self._AUX_DATA_FLUSH_DELAY_SEC, IRRemote.auxDataFlush)
+					IRRemote._auxDataTimer.daemon = True  #The atexit flush covers a pending write.
+					IRRemote._auxDataTimer.start()
 
 	def _functionsRefresh(self):
 		"""
@@ -877,17 +1187,48 @@ class IRRemote:
 		jsonDataFunctions = jsonData.get('remotes', {}).get(self.uuid, {}).get('functions', {})
 		for (fName, jsonDataFunction) in jsonDataFunctions.items():
 			self.functions[fName] = IRRemoteFunction.fromJSON(jsonDataFunction)
-		for fName in self._remoteData.get('Functions'):
-			apiFunctionData = self._lookinRemote.api_data_uuid_function_GET(self.uuid, fName)
+		for fName in self._remoteData.get('Functions', ()):  #Commands stay on the device, so there's nothing to fetch per function.
 			self.functions[fName] = IRRemoteFunction(fName, None)  #Override anything defined in aux data.
 
 	def _remoteDataRefresh(self):
 		"""
-		Refreshes `self._remoteData` to match what's on the device.
+		Refreshes `self._remoteData` to match what's on the device.  Deferred
+		until the outermost `batch` block exits.
 		"""
-		self._remoteData = self._lookinRemote.api_data_uuid_GET(self.uuid)
+		if self._batchDepth:
+			return
+		self._remoteData = self._lookinRemote.remoteData(self.uuid)
 		self._functionsRefresh()
 
+	@contextmanager
+	def batch(self):
+		"""
+		Context manager that defers refreshing this remote from the device until
+		the block exits, so a series of function changes costs one refresh
+		instead of one or two per change:
+
+		@code
+			with remote.batch():
+				remote.functionUpdate(powerFunction)
+				remote.functionDelete('oldFunction')
+		@endcode
+
+		Inside the block, `functions` is only updated with the changes made
+		through this object.
+		"""
+		self._batchDepth += 1
+		try:
+			yield self
+		except BaseException:
+			self._batchDepth -= 1
+			try:
+				self._remoteDataRefresh()  #Still pick up whatever changes landed before the error.
+			except Exception as ex:  #Don't let this mask the block's own exception.
+				_logger.warning('Error refreshing remote after a failed batch: %r', ex)
+			raise
+		self._batchDepth -= 1
+		self._remoteDataRefresh()
+
 	def details(self):
 		"""
 		Returns this remote's details.
@@ -911,8 +1252,9 @@ class IRRemote:
 
 		`irRemoteFunction` should be a `IRRemoteFunction` object.
 		"""
-		if self.functionExists(irRemoteFunction.name):
+		if self.functionExists(irRemoteFunction.name, refresh=True):
 			raise ValueError(f'Given function name {irRemoteFunction.name!r} already exists for remote UUID {self.uuid!r}.')
+		ret = None
 		try:
 			signals = []
 			for irRemoteCommand in irRemoteFunction.irCommands:
@@ -927,22 +1269,36 @@ class IRRemote:
 				irRemoteFunction.functionType.value,
 				signals,
 			)
-		except (ConnectionResetError, socket.timeout, urllib.error.URLError):
+			self.functions[irRemoteFunction.name] = IRRemoteFunction(irRemoteFunction.name, None)  #As `_functionsRefresh` would list it.
+		except (ConnectionResetError, socket.timeout, urllib.error.URLError, urllib3.exceptions.HTTPError):
 			if self._auxDataFilePath is None:
 				raise
 			else:
 				print('Error writing function to device; saving to auxiliary data file...')
 				self.functions[irRemoteFunction.name] = irRemoteFunction
 				self._auxDataSave()
+				IRRemote.auxDataFlush()  #Write now; this is the only copy of the function.
 				print('...Done!')
 		self._remoteDataRefresh()
 		return ret
 
+	def functionCreateMany(self, irRemoteFunctions):
+		"""
+		Creates each function in `irRemoteFunctions` like `functionCreate`, but
+		refreshes from the device once at the end instead of after every
+		function.  Returns a `list` of the responses.
+
+		The uploads are sent one at a time over the pooled connection, since
+		the device struggles with concurrent writes.
+		"""
+		with self.batch():
+			return [self.functionCreate(irRemoteFunction) for irRemoteFunction in irRemoteFunctions]
+
 	def functionDelete(self, functionName):
 		"""
 		Deletes the function `functionName` from the device.
 		"""
-		if not self.functionExists(functionName):
+		if not self.functionExists(functionName, refresh=True):
 			raise ValueError(f'Given function name {functionName!r} does NOT exist for remote UUID {self.uuid!r}.')
 		ret = self._lookinRemote.api_data_uuid_function_DEL(self.uuid, functionName)
 		del self.functions[functionName]
@@ -950,11 +1306,15 @@ class IRRemote:
 		self._remoteDataRefresh()
 		return ret
 
-	def functionExists(self, functionName):
+	def functionExists(self, functionName, refresh=False):
 		"""
 		Returns `True` if a function named `functionName` is defined.
+
+		Checks the functions known to this object unless `refresh` is true, in
+		which case they're first refreshed from the device.
 		"""
-		self._remoteDataRefresh()
+		if refresh:
+			self._remoteDataRefresh()
 		return functionName in self.functions
 
 	def functionTrigger(self, functionName):
@@ -973,7 +1333,8 @@ class IRRemote:
 		If `upsert` is true, will create the function if it doesn't currently
 		exist.
 		"""
-		if not upsert and not self.functionExists(functionName):
+		functionName = irRemoteFunction.name
+		if not upsert and not self.functionExists(functionName, refresh=True):
 			raise ValueError(f'Given function name {functionName!r} does not exists for remote UUID {self.uuid!r}.')
 		ret = None
 		try:
@@ -986,15 +1347,17 @@ class IRRemote:
 				signals.append(irRemoteCommand.toLOOKinRemoteAPIJSON())
 			ret = self._lookinRemote.api_data_uuid_function_PUT(
 				self.uuid,
-				irRemoteFunction.name,
-				irRemoteFunction.functionType.value,
-				signals,
-				str(time.time())
+				functionName,
+				str(time.time()),
+				functionType=irRemoteFunction.functionType.value,
+				signals=signals,
 			)
-		except (ConnectionResetError, socket.timeout, urllib.error.URLError):
+			self.functions[functionName] = IRRemoteFunction(functionName, None)  #As `_functionsRefresh` would list it.
+		except (ConnectionResetError, socket.timeout, urllib.error.URLError, urllib3.exceptions.HTTPError):
 			print('Error writing function to device; saving to auxiliary data file...')
 			self.functions[irRemoteFunction.name] = irRemoteFunction
 			self._auxDataSave()
+			IRRemote.auxDataFlush()  #Write now; this is the only copy of the function.
 			print('...Done!')
 		self._remoteDataRefresh()
 		return ret
@@ -1028,7 +1391,7 @@ class IRRemote:
 				irRemoteType = IRRemote.TYPE[irRemoteType]
 			elif isinstance(irRemoteType, int):
 				irRemoteType = IRRemote.TYPE(irRemoteType)
-			irRemoteType = hex(irRemoteType.value)[2:].upper()
+			irRemoteType = f'{irRemoteType.value:X}'
 		if extra is None:
 			extra = self._remoteData.get('Extra')
 		return self._lookinRemote.api_data_uuid_PUT(
@@ -1039,14 +1402,36 @@ class IRRemote:
 			extra
 		)
 
+	@property
+	def updated(self):
+		"""
+		`datetime.datetime` of when the remote was last updated.  Converted on
+		first access since most uses of a remote never read it.
+		"""
+		if self._updated is None:
+			self._updated = datetime.datetime.fromtimestamp(
+				int(self._rootData['Updated']),
+				datetime.timezone.utc,
+			)
+		return self._updated
+
 	def __repr__(self):
 		return repr((self._rootData, self._remoteData))
 
 	def __str__(self):
 		return f'{self.uuid} - {self.rType.name} Remote'
 
+atexit.register(IRRemote.auxDataFlush)  #Unsaved aux data would otherwise be lost.
+
 class ACRemote(IRRemote):
 
+	__slots__ = (
+		'_extra',
+		'_status',
+		'_statusLast',
+		'_statusPathPrefix',
+	)
+
 	class OPERATINGMODE(Enum):
 		OFF = 0x0000
 		AUTO = 0x1000
@@ -1101,13 +1486,25 @@ class ACRemote(IRRemote):
 		UNKNOWN14 = 0x000E
 		UNKNOWN15 = 0x000F
 
+	_OPERATINGMODE_BY_NAME = OPERATINGMODE.__members__
+	_OPERATINGMODE_BY_VALUE = {mode.value: mode for mode in OPERATINGMODE}
+	_FANSPEEDMODE_BY_NAME = FANSPEEDMODE.__members__
+	_FANSPEEDMODE_BY_VALUE = {mode.value: mode for mode in FANSPEEDMODE}
+	_SWINGMODE_BY_NAME = SWINGMODE.__members__
+	_SWINGMODE_BY_VALUE = {mode.value: mode for mode in SWINGMODE}
+	_STATUS_DEFAULT = 0x07A0  #OFF, 23°C, AUTO fan, UNKNOWN00 swing; used when the device reports no status.
+
 	class Status:
 
-		operatingMode = None
-		tempTarget_C = None
-		tempTarget_F = None
-		fanSpeedMode = None
-		swingMode = None
+		__slots__ = (
+			'operatingMode',
+			'tempTarget_C',
+			'tempTarget_F',
+			'fanSpeedMode',
+			'swingMode',
+		)
+
+		_TEMPTARGET_F_BY_C = tuple(LOOKinRemote.celsius2Fahrenheit(temp_C) for temp_C in range(16, 32))  #Indexed by `tempTarget_C - 16`.
 
 		def __init__(self, operatingMode, tempTarget_C, fanSpeedMode, swingMode):
 			self.operatingModeSet(operatingMode)
@@ -1125,21 +1522,22 @@ class ACRemote(IRRemote):
 			"""
 			if isinstance(statusBytes, str):
 				statusBytes = int(statusBytes, 16)
-			return cls(
-				statusBytes & 0xF000,
-				((statusBytes & 0x0F00) >> 8) + 16,
-				statusBytes & 0x00F0,
-				statusBytes & 0x000F,
-			)
+			ret = cls.__new__(cls)  #Every decoded field is valid, so skip the setters' checks.
+			ret.operatingMode = ACRemote._OPERATINGMODE_BY_VALUE[statusBytes & 0xF000]
+			ret.tempTarget_C = ((statusBytes & 0x0F00) >> 8) + 16
+			ret.tempTarget_F = cls._TEMPTARGET_F_BY_C[ret.tempTarget_C - 16]
+			ret.fanSpeedMode = ACRemote._FANSPEEDMODE_BY_VALUE[statusBytes & 0x00F0]
+			ret.swingMode = ACRemote._SWINGMODE_BY_VALUE[statusBytes & 0x000F]
+			return ret
 
 		def operatingModeSet(self, operatingMode):
 			"""
 			Sets this object's operating mode to `operatingMode`.
 			"""
 			if isinstance(operatingMode, str):
-				operatingMode = ACRemote.OPERATINGMODE[operatingMode]
+				operatingMode = ACRemote._OPERATINGMODE_BY_NAME[operatingMode]
 			elif isinstance(operatingMode, int):
-				operatingMode = ACRemote.OPERATINGMODE(operatingMode)
+				operatingMode = ACRemote._OPERATINGMODE_BY_VALUE.get(operatingMode) or ACRemote.OPERATINGMODE(operatingMode)  #Enum call raises `ValueError` on unknown values.
 			if not isinstance(operatingMode, ACRemote.OPERATINGMODE):
 				raise ValueError(f'Unexpected data type for `operatingMode`: {type(operatingMode)}')
 			self.operatingMode = operatingMode
@@ -1150,9 +1548,9 @@ class ACRemote(IRRemote):
 			"""
 			if (31 < tempTarget_C or 16 > tempTarget_C):
 				raise ValueError('Only temperatures between 16°C and 31°C are supported.')
-			tempTarget_C = min(31, max(16, int(tempTarget_C)))
+			tempTarget_C = int(tempTarget_C)  #Already range-checked above, so no clamping needed.
 			self.tempTarget_C = tempTarget_C
-			self.tempTarget_F = LOOKinRemote.celsius2Fahrenheit(tempTarget_C)
+			self.tempTarget_F = self._TEMPTARGET_F_BY_C[tempTarget_C - 16]
 
 		def tempTargetSet_F(self, tempTarget_F):
 			"""
@@ -1171,23 +1569,28 @@ class ACRemote(IRRemote):
 				| self.swingMode.value
 			)
 
+		def copy(self):
+			"""
+			Returns a new, independent instance with the same status.
+			"""
+			return type(self).fromStatusBytes(self.toStatusBytes())
+
 		def __eq__(self, rhs):
-			if isinstance(rhs, type(self)):
-				return (
-					rhs.operatingMode is self.operatingMode
-					and rhs.tempTarget_C is self.tempTarget_C
-					and rhs.fanSpeedMode is self.fanSpeedMode
-					and rhs.swingMode is self.swingMode
-				)
+			if not isinstance(rhs, type(self)):
+				return NotImplemented
+			return self.toStatusBytes() == rhs.toStatusBytes()
+
+		def __hash__(self):
+			return self.toStatusBytes()
 
 		def fanSpeedModeSet(self, fanSpeedMode):
 			"""
 			Sets this object's fan speed to `fanSpeedMode`.
 			"""
 			if isinstance(fanSpeedMode, str):
-				fanSpeedMode = ACRemote.FANSPEEDMODE[fanSpeedMode]
+				fanSpeedMode = ACRemote._FANSPEEDMODE_BY_NAME[fanSpeedMode]
 			elif isinstance(fanSpeedMode, int):
-				fanSpeedMode = ACRemote.FANSPEEDMODE(fanSpeedMode)
+				fanSpeedMode = ACRemote._FANSPEEDMODE_BY_VALUE.get(fanSpeedMode) or ACRemote.FANSPEEDMODE(fanSpeedMode)  #Enum call raises `ValueError` on unknown values.
 			self.fanSpeedMode = fanSpeedMode
 
 		def __str__(self):
@@ -1198,9 +1601,9 @@ class ACRemote(IRRemote):
 			Sets this object's swing mode to `swingMode`.
 			"""
 			if isinstance(swingMode, str):
-				swingMode = ACRemote.SWINGMODE[swingMode]
+				swingMode = ACRemote._SWINGMODE_BY_NAME[swingMode]
 			elif isinstance(swingMode, int):
-				swingMode = ACRemote.SWINGMODE(swingMode)
+				swingMode = ACRemote._SWINGMODE_BY_VALUE.get(swingMode) or ACRemote.SWINGMODE(swingMode)  #Enum call raises `ValueError` on unknown values.
 			self.swingMode = swingMode
 
 	def __init__(self, *args, **kargs):
@@ -1217,15 +1620,17 @@ class ACRemote(IRRemote):
 		`operatingMode` should be an instance of
 		`pylookinremote.ACRemote.OPERATINGMODE`.
 		"""
-		self._status.operatingModeSet(operatingMode)
-		self.statusSet(self._status)
+		status = self._status.copy()  #Leave the cached status alone until the device confirms it.
+		status.operatingModeSet(operatingMode)
+		self.statusSet(status)
 
 	def tempSet(self, temp_C):
 		"""
 		Tells the device to target the Celsius temperature `temp_C`.
 		"""
-		self._status.tempTargetSet(temp_C)
-		self.statusSet(self._status)
+		status = self._status.copy()
+		status.tempTargetSet(temp_C)
+		self.statusSet(status)
 
 	def tempSetF(self, temp_F):
 		"""
@@ -1240,8 +1645,9 @@ class ACRemote(IRRemote):
 		`fanSpeedMode` should be an instance of
 		`pylookinremote.ACRemote.FANSPEEDMODE`.
 		"""
-		self._status.fanSpeedModeSet(operatingMode)
-		self.statusSet(self._status)
+		status = self._status.copy()
+		status.fanSpeedModeSet(fanSpeedMode)
+		self.statusSet(status)
 
 	def _remoteDataSet(self, remoteData):
 		"""
@@ -1249,14 +1655,11 @@ class ACRemote(IRRemote):
 		"""
 		self._remoteData = remoteData
 		self._extra = self._remoteData.get('Extra')
-		if 'Status' in self._remoteData:
-			self._status = self.Status.fromStatusBytes(self._remoteData['Status'])
-		else:
-			self._status = self.Status('OFF', 23, 'AUTO', 'UNKNOWN00')
-		if 'LastStatus' in self._remoteData:
-			self._statusLast = self.Status.fromStatusBytes(self._remoteData['LastStatus'])
-		else:
-			self._statusLast = self.Status('OFF', 23, 'AUTO', 'UNKNOWN00')
+		self._statusPathPrefix = f'commands/ir/ac/{self._extra}' if self._extra else None  #`None` if the AC codeset is unknown.
+		status = remoteData.get('Status')
+		statusLast = remoteData.get('LastStatus')
+		self._status = self.Status.fromStatusBytes(self._STATUS_DEFAULT if status in (None, '') else status)  #0 is a valid status; only missing/empty values fall back.
+		self._statusLast = self.Status.fromStatusBytes(self._STATUS_DEFAULT if statusLast in (None, '') else statusLast)
 
 	def swingModeSet(self, swingMode):
 		"""
@@ -1265,12 +1668,15 @@ class ACRemote(IRRemote):
 		`swingMode` should be an instance of
 		`pylookinremote.ACRemote.SWINGMODE`.
 		"""
-		self._status.swingModeSet(operatingMode)
-		self.statusSet(self._status)
+		status = self._status.copy()
+		status.swingModeSet(swingMode)
+		self.statusSet(status)
 
 	def statusGet(self, refresh=False):
 		"""
 		Returns the current status of the device.
+
+		Will return the cached state unless `refresh` is `True`.
 		"""
 		if refresh:
 			return self.statusRefresh()
@@ -1279,10 +1685,8 @@ class ACRemote(IRRemote):
 	def statusRefresh(self):
 		"""
 		Requests the current status from the device.
-
-		Will return the cached state unless `refresh` is `True`.
 		"""
-		self._remoteDataSet(self._lookinRemote.remoteData(self._uuid))
+		self._remoteDataSet(self._lookinRemote.remoteData(self.uuid, refresh=True))
 		return self._status
 
 	def statusSet(self, status):
@@ -1291,20 +1695,47 @@ class ACRemote(IRRemote):
 
 		`status` should be an instance of `pylookinremote.ACRemote.Status`.
 		"""
+		if self._statusPathPrefix is None:
+			raise ValueError(f'Remote UUID {self.uuid!r} has no AC codeset ("Extra") defined; cannot send a status.')
+		statusBytes = status.toStatusBytes()
+		if self.statusRefresh().toStatusBytes() == statusBytes:
+			return  #Already there; skip the IR transmission and polling.
+		path = f'{self._statusPathPrefix}{statusBytes:04X}'
+		def isDone():
+			self.statusRefresh()
+			_logger.debug('statusSet - polled %s', self._status)
+			return self._status.toStatusBytes() == statusBytes
 		retries = 5
 		for tryNum in range(retries):
-			self._lookinRemote._get(f'commands/ir/ac/{self._extra}{status.toStatusBytes():04X}')
-			timeout = time.time() + 30
-			while(time.time() < timeout):
-				time.sleep(5)  #The command takes a few seconds to process even when it works well.
-				self.statusRefresh()
-				print(self._status)
-				if self._status == status:
+			try:
+				resp = _jsonLoads(self._lookinRemote._api_get(path))
+			except ValueError:  #Not JSON.
+				resp = None
+			except (ConnectionResetError, socket.timeout, urllib.error.URLError, urllib3.exceptions.HTTPError) as ex:  #The command may still have landed; polling will tell.
+				_logger.warning('Error while sending status to device: %r', ex)
+				resp = None
+			if isinstance(resp, dict) and 'Status' in resp:  #Device echoed its resulting status; no need to poll for it.
+				self._remoteData['Status'] = resp['Status']
+				self._status = self.Status.fromStatusBytes(resp['Status'])
+				self._lookinRemote.remoteDataInvalidate(self.uuid)
+				if self._status.toStatusBytes() == statusBytes:
 					return
-			print(f'Timed Out Attempt {tryNum + 1} of {retries}...')
+			if self._lookinRemote._pollUntil(isDone):
+				return
+			_logger.warning('Timed Out Attempt %d of %d...', tryNum + 1, retries)
 		else:
 			raise TimeoutError(f'FAILED to set status!')
 
+	async def statusSetAsync(self, status):
+		"""
+		Coroutine version of `statusSet`.  The blocking send-and-poll runs in the
+		event loop's default executor, so several AC units can be driven
+		concurrently, e.g. with `asyncio.gather`.
+		"""
+		await asyncio.get_running_loop().run_in_executor(None, self.statusSet, status)
+
+_REMOTE_CLASS_BY_TYPE = {'EF': ACRemote}  #Maps "Type" IDs to `IRRemote` subclasses; others use `IRRemote`.
+
 class IRRemoteFunction:
 	"""
 	Base class for IR Remote Functions.
@@ -1323,9 +1754,9 @@ class IRRemoteFunction:
 		"""
 		Creates a new `IRRemoteFunction` object from the given `jsonData`.
 		"""
-		irCommands = tuple(
-			IRRemoteCommand.fromJSON(jsonDataCommand) for jsonDataCommand in jsonData.get('irCommands', ())
-		)
+		irCommands = jsonData.get('irCommands', ())
+		if irCommands is not None:  #`None` means stored on the device.
+			irCommands = tuple(IRRemoteCommand.fromJSON(jsonDataCommand) for jsonDataCommand in irCommands)
 		return IRRemoteFunction(
 			jsonData.get('name'),
 			irCommands,
@@ -1369,7 +1800,8 @@ class IRRemoteFunction:
 		`functionName` should be a `str` name for the function.
 
 		`irRemoteCommands` should be either an iterable of `IRRemoteCommand`
-		objects or a single `IRRemoteCommand` object.
+		objects or a single `IRRemoteCommand` object.  `None` indicates the
+		commands are stored on the remote device.
 
 		`functionType` should be a value from `IRRemoteFunction.TYPE`.  Types
 		are undocumented on the LOOKin API documentation.  Here's what I think I
@@ -1392,6 +1824,12 @@ class IRRemoteFunction:
 			raise ValueError('`functionType` may not be `None`.')
 		if not isinstance(functionType, IRRemoteFunction.TYPE):
 			functionType = IRRemoteFunction.TYPE(functionType)
+		self.name = functionName
+		self.functionType = functionType
+		if irRemoteCommands is None:
+			self.irCommands = None
+			return
+		irRemoteCommands = tuple(irRemoteCommands)  #Make it immutable; also accepts any iterable.
 		irRemoteCommandsLenAct = len(irRemoteCommands)
 		if functionType is IRRemoteFunction.TYPE.SINGLE:
 			irRemoteCommandsLenExp = 1
@@ -1403,16 +1841,12 @@ class IRRemoteFunction:
 			raise ValueError(
 				f'Expected {irRemoteCommandsLenExp} `IRRemoteCommand` object(s) for function type {functionType.name!r}; found {irRemoteCommandsLenAct}.'
 			)
-		self.name = functionName
-		self.functionType = functionType;
-		self.irCommands = []
 		for irRemoteCommand in irRemoteCommands:
 			if not isinstance(irRemoteCommand, IRRemoteCommand):
 				raise ValueError(
 					f'`irRemoteCommands` contained an object of unexpected type {type(irRemoteCommand)!r}.'
 				)
-			self.irCommands.append(irRemoteCommand)
-		self.irCommands = tuple(self.irCommands)  #Make it immutable.
+		self.irCommands = irRemoteCommands
 
 	def toJSON(self):
 		"""
@@ -1544,8 +1978,9 @@ class IRRemoteCommandRaw(IRRemoteCommand):
 		if isinstance(sequence, str):
 			sequence = IRRemoteCommandRaw._parse(sequence)
 		self._freqCarrier_Hz = freqCarrier_Hz
-		self._hash = hash(sequence)
-		self._sequence = sequence
+		self._sequence = array('i', sequence)  #4 bytes per sample instead of a boxed `int` each.
+		self._hash = hash(self._sequence.tobytes())
+		self._apiJSON = None  #Cache for `toLOOKinRemoteAPIJSON`.
 
 	def __eq__(self, rhs):
 		"""
@@ -1553,12 +1988,21 @@ class IRRemoteCommandRaw(IRRemoteCommand):
 		"""
 		return (
 			type(self) == type(rhs)
-			and self._hash == rhs._hash
+			and self._hash == rhs._hash  #Cheap rejection for most non-equal pairs.
+			and self._sequence == rhs._sequence  #Rules out hash collisions.
 		)
 
 	def __hash__(self):
 		return self._hash
 
+	@cached_property
+	def _sequenceAbs(self):
+		"""
+		`tuple` of the sample magnitudes for `_compare`.  Only built for commands
+		that get compared, i.e. while learning.
+		"""
+		return tuple(map(abs, self._sequence))
+
 	@staticmethod
 	def _compare(lhs, rhs):
 		"""
@@ -1566,84 +2010,72 @@ class IRRemoteCommandRaw(IRRemoteCommand):
 		match.
 		"""
 		if isinstance(lhs, str):
-			lhs = IRRemoteCommandRaw._parse(lhs)
+			lhs = IRRemoteCommandRaw(lhs)
 		if isinstance(rhs, str):
-			rhs = IRRemoteCommandRaw._parse(rhs)
+			rhs = IRRemoteCommandRaw(rhs)
+		if len(lhs) != len(rhs):  #Can't match; skip comparing the samples.
+			_logger.debug('IR COMMAND LENGTH %d<=>%d IS DIFFERENT; NOT A MATCH', len(lhs), len(rhs))
+			return False
 		sampleDiffThreshold = 0.10  #10% maximum difference to match.
-		samplesNumDiff = abs(len(lhs) - len(rhs))
-		samplesNum = max(len(lhs), len(rhs))
 		commandDiffThreshold = 0.02  #2% maximum difference to match.
-		commandDiffPct = -1
-		# print(f'Lengths: ')
-		for (idx, (lhsSample, rhsSample)) in enumerate(zip(lhs._sequence, rhs._sequence)):
-			pctDiff = abs(abs(lhsSample) - abs(rhsSample)) / (abs(lhsSample) + abs(rhsSample))
-			if (pctDiff > sampleDiffThreshold):
-				samplesNumDiff += 1
-				# print(f'{idx:03d}: {lhsSample:>5d}<=>{rhsSample:>5d}; {pctDiff * 100:>2.0f}%diff')
-		# print(f'{samplesNumDiff} samples different; {samplesNum - samplesNumDiff} samples similar')
-		commandDiffPct = (samplesNumDiff / samplesNum)
-		isMatch = (
-			len(lhs) == len(rhs)
-			and commandDiffThreshold >= commandDiffPct
+		samplesNumDiff = sum(  #`|a - b| > t * (a + b)` is `|a - b| / (a + b) > t` without a division per sample.
+			abs(lhsSample - rhsSample) > sampleDiffThreshold * (lhsSample + rhsSample)
+			for (lhsSample, rhsSample) in zip(lhs._sequenceAbs, rhs._sequenceAbs)
+		)
+		commandDiffPct = (samplesNumDiff / len(lhs))
+		isMatch = commandDiffThreshold >= commandDiffPct
+		_logger.debug(
+			'IR COMMANDS ARE %.0f%% SIMILAR; LENGTH %d IS SAME; %s',
+			(1 - commandDiffPct) * 100,
+			len(lhs),
+			'MATCH!' if isMatch else 'NOT A MATCH',
 		)
-		print(f'IR COMMANDS ARE {(1 - commandDiffPct) * 100:.0f}% SIMILAR; LENGTH {len(lhs)}<=>{len(rhs)} IS {"SAME" if len(lhs) == len(rhs) else "DIFFERENT"}; {"MATCH!" if isMatch else "NOT A MATCH"}')
-		return commandDiffThreshold >= commandDiffPct
+		return isMatch
 
 	@staticmethod
 	def _groupCommands(irRemoteCommands, minMatches=2):
 		"""
 		Returns the groups of `IRRemoteCommandRaw` objects that match each other as a
-		`dict` mapping a `IRRemoteCommandRaw` object to a `set` of `IRRemoteCommandRaw`
-		objects.
+		`dict` mapping a `IRRemoteCommandRaw` object to a `list` of `IRRemoteCommandRaw`
+		objects.  Matches are transitive: commands similar to any member of a
+		group join that group.
 
 		Groups with less than `minMatches` members will be excluded from the output.
 		"""
+		#Union-find over list indices; indices also keep identical IR sequences apart.
+		parents = list(range(len(irRemoteCommands)))
+		def find(idx):
+			while parents[idx] != idx:
+				parents[idx] = parents[parents[idx]]  #Path halving.
+				idx = parents[idx]
+			return idx
+		buckets = {}  #Maps sequence lengths to command indices; only equal lengths can match.
+		for (idx, irRemoteCommand) in enumerate(irRemoteCommands):
+			buckets.setdefault(len(irRemoteCommand), []).append(idx)
+		for bucket in buckets.values():
+			for (lhsIdx, rhsIdx) in combinations(bucket, 2):
+				lhsRoot = find(lhsIdx)
+				rhsRoot = find(rhsIdx)
+				if lhsRoot != rhsRoot and irRemoteCommands[lhsIdx].isSimilar(irRemoteCommands[rhsIdx]):  #Found a match!
+					parents[max(lhsRoot, rhsRoot)] = min(lhsRoot, rhsRoot)  #Earliest command stays the group's key.
+		groups = {}  #Maps root indices to a list of similar `IRRemoteCommand` objects.
+		for (idx, irRemoteCommand) in enumerate(irRemoteCommands):
+			groups.setdefault(find(idx), []).append(irRemoteCommand)
 		retCommands = {}  #Maps `IRRemoteCommand` objects to a list of similar `IRRemoteCommand` objects.
-		retIDs = {}  #Maps `int` object IDs to a `set` of `int` object IDs.
-		for (lhs, rhs) in combinations(irRemoteCommands, 2):
-			#Have to use IDs to handle identical IR sequences.
-			lhsID = id(lhs)
-			rhsID = id(rhs)
-			if lhs.isSimilar(rhs):  #Found a match!
-				if lhsID in retIDs:
-					if rhsID not in retIDs[lhsID]:
-						retCommands[lhs].append(rhs)
-						retIDs[lhsID].add(rhsID)
-				elif rhsID in retIDs:
-					if lhsID not in retIDs[rhsID]:
-						retCommands[rhs].append(lhs)
-						retIDs[rhsID].add(lhsID)
-				else:
-					matchFound = False
-					for key in retCommands.keys():
-						if key.isSimilar(lhs) or key.isSimilar(rhs):  #Add to existing group(s).
-							matchFound = True
-							keyID = id(key)
-							if lhsID not in retIDs[keyID]:
-								retCommands[key].append(lhs)
-								retIDs[keyID].add(lhsID)
-							if rhsID not in retIDs[keyID]:
-								retCommands[key].append(rhs)
-								retIDs[keyID].add(rhsID)
-							#Do NOT break; we want to correlate with all similar key signals.
-					if not matchFound:  #Create new group.
-						retCommands[lhs] = [lhs, rhs]
-						retIDs[lhsID] = {lhsID, rhsID}
-		toDelete = []
-		for (key, values) in retCommands.items():
-			if len(values) < minMatches:
-				toDelete.append(key)
-		for key in toDelete:
-			del retCommands[key]
-		print(f'Found {len(retCommands)} groups of commands.\n\n\n')
+		for (rootIdx, values) in groups.items():
+			if len(values) >= minMatches:
+				retCommands[irRemoteCommands[rootIdx]] = values
+		_logger.info('Found %d groups of commands.', len(retCommands))
 		return retCommands
 
 	@staticmethod
+	@lru_cache(maxsize=512)
 	def _parse(ir_str):
 		"""
-		Parses the IR command string into a `tuple` of `int`.
+		Parses the IR command string into a `tuple` of `int`.  Results are
+		memoized since the same captures and saved signals get parsed repeatedly.
 		"""
-		return tuple(int(x) for x in ir_str.split())
+		return tuple(map(int, ir_str.split()))
 
 	def isSimilar(self, rhs):
 		"""
@@ -1668,14 +2100,17 @@ class IRRemoteCommandRaw(IRRemoteCommand):
 	def toLOOKinRemoteAPIJSON(self):
 		"""
 		Returns a JSON-compatible data structure that represents this object
-		appropriately for the LOOKin Device API.
-		"""
-		return {
-			'raw': {
-				'Frequency': str(self._freqCarrier_Hz),
-				'Signal': ' '.join(str(sample) for sample in self._sequence),
-			},
-		}
+		appropriately for the LOOKin Device API.  Built on first call and
+		shared afterwards, so don't modify it.
+		"""
+		if self._apiJSON is None:
+			self._apiJSON = {
+				'raw': {
+					'Frequency': str(self._freqCarrier_Hz),
+					'Signal': ' '.join(map(str, self._sequence.tolist())),
+				},
+			}
+		return self._apiJSON
 
 	def trigger(self, lookinRemote):
 		"""
@@ -1687,8 +2122,7 @@ if __name__ == '__main__':
 	auxDataFilePath='./auxData.json'
 	# dev = LOOKinRemote('192.168.1.123', auxDataFilePath)
 	devs = LOOKinRemote.findInNetwork(auxDataFilePath=auxDataFilePath)
-	for dev in devs:
-		meteoSensorMeas = dev.sensor('Meteo')
+	for (dev, meteoSensorMeas) in zip(devs, LOOKinRemote.sensorAll(devs, 'Meteo')):
 		temp_C = meteoSensorMeas['Temperature']
 		temp_F = LOOKinRemote.celsius2Fahrenheit(meteoSensorMeas['Temperature'])
 		humidityRel = meteoSensorMeas['Humidity']